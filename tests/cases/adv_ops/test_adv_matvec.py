@@ -1,3 +1,4 @@
+import functools
 from openfhe import *
 import openfhe_numpy as onp
 from core import *
@@ -5,50 +6,51 @@ from core import *
 SIZES = [2, 3, 5, 16]
 
 
+def _supported_sizes(ring_dim: int) -> list:
+    """Sizes a parameter set can run; sizes above 4 need ringDim >= 8192."""
+    return [size for size in SIZES if size <= ring_dim // 2 and (ring_dim >= 8192 or size <= 4)]
+
+
+def _make_inputs() -> dict:
+    """Draw (A, b, A @ b) once per size; every parameter set checks the same inputs."""
+    inputs = {}
+    for size in SIZES:
+        A = generate_random_array(rows=size, cols=size)
+        b = generate_random_array(rows=size)
+        inputs[size] = (A, b, A @ b)
+    return inputs
+
+
 # -----------------------------------------------------------
 #   Matrix (row-major, tile) x Vector (column-major, tile)
 # -----------------------------------------------------------
 class TestRowMajorColMajor(MainUnittest):
     def test_mult_matrix_vector(self):
         ckks_params = load_ckks_params()
+        inputs = _make_inputs()
 
         for p in ckks_params:
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
-
             batch_size = p["ringDim"] // 2
-            for size in SIZES:
-                if (size > 4 and p["ringDim"] < 8192) or size > batch_size:
-                    continue
-
-                A = generate_random_array(rows=size, cols=size)
-                b = generate_random_array(rows=size)
+            sizes = _supported_sizes(p["ringDim"])
+            if not sizes:
+                continue
+            cc, keys = get_cached_crypto_context(p)
+            encrypt = functools.partial(
+                onp.array, cc=cc, batch_size=batch_size, fhe_type="C", public_key=keys.publicKey
+            )
 
-                expected = A @ b
+            for size in sizes:
+                A, b, expected = inputs[size]
 
                 with self.subTest(size=size, ringDim=p["ringDim"]):
                     result = None
+                    ctm = None
+                    ctv = None
+                    ctv_result = None
                     try:
-                        ctm = onp.array(
-                            cc=cc,
-                            data=A,
-                            batch_size=batch_size,
-                            order=onp.ROW_MAJOR,
-                            fhe_type="C",
-                            mode="tile",
-                            public_key=keys.publicKey,
-                        )
-                        ctm.extra["colkey"] = onp.sum_col_keys(keys.secretKey, ctm.ncols)
-                        ctv = onp.array(
-                            cc=cc,
-                            data=b,
-                            batch_size=batch_size,
-                            order=onp.COL_MAJOR,
-                            fhe_type="C",
-                            mode="tile",
-                            public_key=keys.publicKey,
-                        )
+                        ctm = encrypt(data=A, order=onp.ROW_MAJOR, mode="tile")
+                        ctm.extra["colkey"] = get_cached_sum_col_keys(keys.secretKey, ctm.ncols)
+                        ctv = encrypt(data=b, order=onp.COL_MAJOR, mode="tile")
                         ctv_result = ctm @ ctv
                         result = ctv_result.decrypt(keys.secretKey, unpack_type="original")
 
@@ -66,6 +68,8 @@ class TestRowMajorColMajor(MainUnittest):
                             result=result,
                         )
                         raise
+                    finally:
+                        del ctm, ctv, ctv_result, result
 
 
 # -------------------------------------------------------------
@@ -74,44 +78,34 @@ class TestRowMajorColMajor(MainUnittest):
 class TestColMajorRowMajor(MainUnittest):
     def test_mult_matrix_vector(self):
         ckks_params = load_ckks_params()
+        inputs = _make_inputs()
         for p in ckks_params:
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
-
             batch_size = p["ringDim"] // 2
-            for size in SIZES:
-                if (size > 4 and p["ringDim"] < 8192) or size > batch_size:
-                    continue
+            sizes = _supported_sizes(p["ringDim"])
+            if not sizes:
+                continue
+            cc, keys = get_cached_crypto_context(p)
+            encrypt = functools.partial(
+                onp.array, cc=cc, batch_size=batch_size, fhe_type="C", public_key=keys.publicKey
+            )
 
-                A = generate_random_array(rows=size, cols=size)
-                b = generate_random_array(rows=size)
-
-                expected = A @ b
+            for size in sizes:
+                A, b, expected = inputs[size]
 
                 with self.subTest(size=size, ringDim=p["ringDim"]):
                     result = None
+                    ctm = None
+                    ctv = None
+                    ctv_result = None
                     try:
-                        ctm = onp.array(
-                            cc=cc,
-                            data=A,
-                            batch_size=batch_size,
-                            order=onp.COL_MAJOR,
-                            fhe_type="C",
-                            mode="zero",
-                            public_key=keys.publicKey,
-                        )
-                        ctv = onp.array(
-                            cc=cc,
+                        ctm = encrypt(data=A, order=onp.COL_MAJOR, mode="zero")
+                        ctv = encrypt(
                             data=b,
-                            batch_size=batch_size,
                             order=onp.ROW_MAJOR,
-                            fhe_type="C",
                             mode="zero",
                             target_cols=ctm.nrows,
-                            public_key=keys.publicKey,
                         )
-                        ctm.extra["rowkey"] = onp.sum_row_keys(
+                        ctm.extra["rowkey"] = get_cached_sum_row_keys(
                             keys.secretKey, ctm.nrows, ctm.batch_size
                         )
                         ctv_result = ctm @ ctv
@@ -131,3 +125,5 @@ class TestColMajorRowMajor(MainUnittest):
                             result=result,
                         )
                         raise
+                    finally:
+                        del ctm, ctv, ctv_result, result
@@ -23,8 +23,6 @@ def _run_scalar_vector_ops(test_case, tag, np_fn, fhe_fn):
         batch_size = p["ringDim"] // 2
 
         cc, keys = gen_crypto_context(p)
-        cc.EvalMultKeyGen(keys.secretKey)
-        cc.EvalSumKeyGen(keys.secretKey)
 
         try:
             for size in SIZES_VECTOR:
@@ -98,8 +96,6 @@ def _run_scalar_matrix_ops(self, ops):
         batch_size = p["ringDim"] // 2
 
         cc, keys = gen_crypto_context(p)
-        cc.EvalMultKeyGen(keys.secretKey)
-        cc.EvalSumKeyGen(keys.secretKey)
 
         try:
             for rows, cols in SIZES_MAT:
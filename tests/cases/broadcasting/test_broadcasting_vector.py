@@ -19,11 +19,9 @@ OPS = [
 class TestVectorBroadcasting(MainUnittest):
     def _run(self, tag, np_fn, fhe_fn):
         ckks_params = load_ckks_params()
-        for _, p in enumerate(ckks_params):
+        for p in ckks_params:
             batch_size = p["ringDim"] // 2
             cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
             try:
                 for rows, cols in SIZES_MAT:
                     if onp.next_power_of_two(rows) * onp.next_power_of_two(cols) > batch_size:
@@ -1,4 +1,4 @@
-import gc
+import functools
 import numpy as np
 from openfhe import *
 import openfhe_numpy as onp
@@ -16,45 +16,61 @@ def _ensure_depth(p: dict, min_depth: int = 3) -> dict:
     return params
 
 
+def _required_depth(size: int) -> int:
+    """Multiplicative depth needed to accumulate a size x size matrix."""
+    return size + 1
+
+
+def _sizes_by_depth(p: dict, sizes: list) -> dict:
+    """
+    Group sizes by the context depth they run at.
+
+    Sizes within the parameter set's own depth share its cached context;
+    only larger ones get a deeper context.
+    """
+    groups = {}
+    for size in sizes:
+        depth = _ensure_depth(p, _required_depth(size))["multiplicativeDepth"]
+        groups.setdefault(depth, []).append(size)
+    return groups
+
+
 class TestMatrixCumulativeSumRow(MainUnittest):
     def test_cumsum_rows(self):
         ckks_params = load_ckks_params()
 
         for p in ckks_params:
             batch_size = p["ringDim"] // 2
+            sizes = [size for size in SIZES if size <= batch_size]
+            if not sizes:
+                continue
+
+            for depth, depth_sizes in _sizes_by_depth(p, sizes).items():
+                cc, keys = get_cached_crypto_context({**p, "multiplicativeDepth": depth})
+                encrypt = functools.partial(
+                    onp.array,
+                    cc=cc,
+                    batch_size=batch_size,
+                    fhe_type="C",
+                    public_key=keys.publicKey,
+                )
+
+                for size in depth_sizes:
+                    A = generate_random_array(rows=size, cols=size)
+                    expected = np.cumsum(A, axis=0)
 
-            for size in SIZES:
-                if size > batch_size:
-                    continue
-
-                A = generate_random_array(rows=size, cols=size)
-                expected = np.cumsum(A, axis=0)
-                params = _ensure_depth(p, len(A) + 1)
-                cc, keys = gen_crypto_context(params)
-                cc.EvalMultKeyGen(keys.secretKey)
-                cc.EvalSumKeyGen(keys.secretKey)
-
-                try:
                     for order_name, order_value in ORDERS:
                         with self.subTest(order=order_name, size=size, ringDim=p["ringDim"]):
                             result = None
                             ctm = None
                             ctm_result = None
                             try:
-                                ctm = onp.array(
-                                    cc=cc,
-                                    data=A,
-                                    batch_size=batch_size,
-                                    order=order_value,
-                                    fhe_type="C",
-                                    mode="zero",
-                                    public_key=keys.publicKey,
-                                )
+                                ctm = encrypt(data=A, order=order_value, mode="zero")
 
                                 if order_value == onp.ROW_MAJOR:
-                                    onp.gen_accumulate_rows_key(keys.secretKey, ctm.ncols)
+                                    gen_cached_accumulate_rows_key(keys.secretKey, ctm.ncols)
                                 else:
-                                    onp.gen_accumulate_cols_key(keys.secretKey, ctm.ncols)
+                                    gen_cached_accumulate_cols_key(keys.secretKey, ctm.ncols)
 
                                 ctm_result = onp.cumulative_sum(ctm, axis=0)
                                 result = ctm_result.decrypt(keys.secretKey, unpack_type="original")
@@ -73,10 +89,6 @@ class TestMatrixCumulativeSumRow(MainUnittest):
                                 raise
                             finally:
                                 del ctm, ctm_result, result
-                                gc.collect()
-                finally:
-                    del cc, keys
-                    gc.collect()
 
 
 class TestMatrixCumulativeSumCol(MainUnittest):
@@ -85,39 +97,36 @@ class TestMatrixCumulativeSumCol(MainUnittest):
 
         for p in ckks_params:
             batch_size = p["ringDim"] // 2
+            sizes = [size for size in SIZES if size <= batch_size]
+            if not sizes:
+                continue
+
+            for depth, depth_sizes in _sizes_by_depth(p, sizes).items():
+                cc, keys = get_cached_crypto_context({**p, "multiplicativeDepth": depth})
+                encrypt = functools.partial(
+                    onp.array,
+                    cc=cc,
+                    batch_size=batch_size,
+                    fhe_type="C",
+                    public_key=keys.publicKey,
+                )
+
+                for size in depth_sizes:
+                    A = generate_random_array(rows=size, cols=size)
+                    expected = np.cumsum(A, axis=1)
 
-            for size in SIZES:
-                if size > batch_size:
-                    continue
-
-                A = generate_random_array(rows=size, cols=size)
-                expected = np.cumsum(A, axis=1)
-                params = _ensure_depth(p, len(A) + 1)
-                cc, keys = gen_crypto_context(params)
-                cc.EvalMultKeyGen(keys.secretKey)
-                cc.EvalSumKeyGen(keys.secretKey)
-
-                try:
                     for order_name, order_value in ORDERS:
                         with self.subTest(order=order_name, size=size, ringDim=p["ringDim"]):
                             result = None
                             ctm = None
                             ctm_result = None
                             try:
-                                ctm = onp.array(
-                                    cc=cc,
-                                    data=A,
-                                    batch_size=batch_size,
-                                    order=order_value,
-                                    fhe_type="C",
-                                    mode="zero",
-                                    public_key=keys.publicKey,
-                                )
+                                ctm = encrypt(data=A, order=order_value, mode="zero")
 
                                 if order_value == onp.ROW_MAJOR:
-                                    onp.gen_accumulate_cols_key(keys.secretKey, ctm.ncols)
+                                    gen_cached_accumulate_cols_key(keys.secretKey, ctm.ncols)
                                 else:
-                                    onp.gen_accumulate_rows_key(keys.secretKey, ctm.ncols)
+                                    gen_cached_accumulate_rows_key(keys.secretKey, ctm.ncols)
 
                                 ctm_result = onp.cumulative_sum(ctm, axis=1)
                                 result = ctm_result.decrypt(keys.secretKey, unpack_type="original")
@@ -136,7 +145,3 @@ class TestMatrixCumulativeSumCol(MainUnittest):
                                 raise
                             finally:
                                 del ctm, ctm_result, result
-                                gc.collect()
-                finally:
-                    del cc, keys
-                    gc.collect()
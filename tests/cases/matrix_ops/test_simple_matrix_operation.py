@@ -10,6 +10,9 @@ SIZES = [5, 8, 16]
 ORDERS = [("row_major", onp.ROW_MAJOR)]
 MODES_UNARY = ["zero"]
 MODES_BINARY = ["tile"]
+# Element-wise ops are also run on real matrix ciphertexts at a size that
+# needs padding, next to the packed check over all SIZES
+UNPACKED_SIZES = [5]
 
 OPS_UNARY = [
     ("transpose", lambda x: x.T, lambda x: onp.transpose(x)),
@@ -29,26 +32,59 @@ class TestMatrixUnaryOps(MainUnittest):
         self._run(*OPS_UNARY[0])
 
     def test_scalar_mul(self):
-        self._run(*OPS_UNARY[1])
+        self._run_packed(*OPS_UNARY[1])
+        self._run(*OPS_UNARY[1], sizes=UNPACKED_SIZES)
 
     def test_sum(self):
         self._run(*OPS_UNARY[2])
 
-    def _run(self, tag, np_fn, fhe_fn):
-
+    def _run_packed(self, tag, np_fn, fhe_fn):
+        """Run an element-wise op once over all SIZES packed into one ciphertext."""
         ckks_params = load_ckks_params()
 
-        for p in ckks_params:
-            batch_size = p["ringDim"] // 2
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+
+                matrices = [generate_random_array(rows=size, cols=size) for size in SIZES]
+                ct_a, offsets = encrypt_batch(cc, keys.publicKey, matrices, batch_size)
+                ct_res = fhe_fn(ct_a, SCALAR)
+                values = ct_res.decrypt(keys.secretKey, unpack_type="raw")
+                del ct_a, ct_res
+                gc.collect()
+
+                for size, A, offset in zip(SIZES, matrices, offsets):
+                    with self.subTest(op=tag, size=size, mode="packed", ringDim=p["ringDim"]):
+                        expected = np_fn(A, SCALAR)
+                        result = unpack_batch(values, A.shape, offset)
+                        try:
+                            self.assertArrayClose(actual=result, expected=expected)
+                        except Exception:
+                            self._record_case(
+                                params={
+                                    "case": "matrix_unary_packed",
+                                    "op": tag,
+                                    "size": size,
+                                    "ringDim": p["ringDim"],
+                                },
+                                input_data={"A": A},
+                                expected=expected,
+                                result=result,
+                            )
+                            raise
 
-            try:
-                for size in SIZES:
-                    if size > batch_size:
-                        continue
+    def _run(self, tag, np_fn, fhe_fn, sizes=SIZES):
 
+        ckks_params = load_ckks_params()
+
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+                eligible = [size for size in sizes if size <= batch_size]
+
+                for size in eligible:
                     A = generate_random_array(rows=size, cols=size)
 
                     for order_name, order_value in ORDERS:
@@ -77,7 +113,7 @@ class TestMatrixUnaryOps(MainUnittest):
                                         expected = np_fn(A, SCALAR)
                                         ctm_res = fhe_fn(ctm_a, SCALAR)
                                     elif tag == "transpose":
-                                        onp.gen_transpose_keys(keys.secretKey, ctm_a)
+                                        gen_cached_transpose_keys(keys.secretKey, ctm_a)
                                         expected = np_fn(A)
                                         ctm_res = fhe_fn(ctm_a)
                                     else:  # sum
@@ -101,45 +137,76 @@ class TestMatrixUnaryOps(MainUnittest):
                                     raise
                                 finally:
                                     del ctm_a, ctm_res, result
-                                    gc.collect()
-            finally:
-                del cc, keys
-                gc.collect()
 
 
 class TestMatrixBinaryOps(MainUnittest):
     def test_add(self):
-        self._run(*OPS_BINARY[0])
+        self._run_packed(*OPS_BINARY[0])
+        self._run(*OPS_BINARY[0], sizes=UNPACKED_SIZES)
 
     def test_sub(self):
-        self._run(*OPS_BINARY[1])
+        self._run_packed(*OPS_BINARY[1])
+        self._run(*OPS_BINARY[1], sizes=UNPACKED_SIZES)
 
     def test_mult(self):
-        self._run(*OPS_BINARY[2])
+        self._run_packed(*OPS_BINARY[2])
+        self._run(*OPS_BINARY[2], sizes=UNPACKED_SIZES)
 
     def test_dot(self):
-        self._run(*OPS_BINARY[2])
-
-    def _run(self, tag, np_fn, fhe_fn):
+        self._run(*OPS_BINARY[3])
 
+    def _run_packed(self, tag, np_fn, fhe_fn):
+        """Run an element-wise op once over all SIZES packed into one ciphertext."""
         ckks_params = load_ckks_params()
 
-        for p in ckks_params:
-            batch_size = p["ringDim"] // 2
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+
+                matrices_a = [generate_random_array(rows=size, cols=size) for size in SIZES]
+                matrices_b = [generate_random_array(rows=size, cols=size) for size in SIZES]
+                ct_a, offsets = encrypt_batch(cc, keys.publicKey, matrices_a, batch_size)
+                ct_b, _ = encrypt_batch(cc, keys.publicKey, matrices_b, batch_size)
+                ct_res = fhe_fn(ct_a, ct_b)
+                values = ct_res.decrypt(keys.secretKey, unpack_type="raw")
+                del ct_a, ct_b, ct_res
+                gc.collect()
+
+                for size, A, B, offset in zip(SIZES, matrices_a, matrices_b, offsets):
+                    with self.subTest(op=tag, size=size, mode="packed", ringDim=p["ringDim"]):
+                        expected = np_fn(A, B)
+                        result = unpack_batch(values, A.shape, offset)
+                        try:
+                            self.assertArrayClose(actual=result, expected=expected)
+                        except Exception:
+                            self._record_case(
+                                params={
+                                    "case": "matrix_binary_packed",
+                                    "op": tag,
+                                    "size": size,
+                                    "ringDim": p["ringDim"],
+                                },
+                                input_data={"A": A, "B": B},
+                                expected=expected,
+                                result=result,
+                            )
+                            raise
 
-            try:
-                for size in SIZES:
-                    if size > batch_size:
-                        continue
+    def _run(self, tag, np_fn, fhe_fn, sizes=SIZES):
 
+        ckks_params = load_ckks_params()
+
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+                eligible = [size for size in sizes if size <= batch_size]
+
+                for size in eligible:
                     A = generate_random_array(rows=size, cols=size)
                     B = generate_random_array(rows=size, cols=size)
                     expected = np_fn(A, B)
-                    if tag == "mul":
-                        onp.EvalSquareMatMultRotateKeyGen(keys.secretKey, size)
 
                     for order_name, order_value in ORDERS:
                         for mode in MODES_BINARY:
@@ -173,6 +240,9 @@ class TestMatrixBinaryOps(MainUnittest):
                                         mode=mode,
                                         public_key=keys.publicKey,
                                     )
+                                    if tag == "dot":
+                                        # Keys depend on the padded width, generated once per width
+                                        gen_cached_square_matmult_key(keys.secretKey, ctm_a.ncols)
                                     ctm_res = fhe_fn(ctm_a, ctm_b)
                                     result = ctm_res.decrypt(keys.secretKey, unpack_type="original")
                                     self.assertArrayClose(actual=result, expected=expected)
@@ -191,7 +261,3 @@ class TestMatrixBinaryOps(MainUnittest):
                                     raise
                                 finally:
                                     del ctm_a, ctm_b, ctm_res, result
-                                    gc.collect()
-            finally:
-                del cc, keys
-                gc.collect()
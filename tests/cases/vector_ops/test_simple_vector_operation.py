@@ -1,3 +1,4 @@
+import gc
 import numpy as np
 from openfhe import *
 import openfhe_numpy as onp
@@ -8,6 +9,9 @@ SCALAR = 7.9
 SIZES = [5, 8, 16]
 ORDERS = [("row_major", onp.ROW_MAJOR)]
 MODES = ["zero"]
+# Element-wise ops are also run on real vector ciphertexts at a length that
+# needs padding, next to the packed check over all SIZES
+UNPACKED_SIZES = [5]
 
 
 class TestVectorUnaryOps(MainUnittest):
@@ -16,148 +20,309 @@ class TestVectorUnaryOps(MainUnittest):
     def test_unary_operations(self):
         ops = [
             ("transpose", lambda x: x.T, lambda x: onp.transpose(x)),
-            ("scalar_mul", lambda x, s: x * s, lambda x, s: x * s),
             ("sum", lambda x: np.sum(x), lambda x: onp.sum(x)),
         ]
 
         ckks_params = load_ckks_params()
 
-        for _, p in enumerate(ckks_params):
-            batch_size = p["ringDim"] // 2
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+                sizes = [size for size in SIZES if size <= batch_size]
 
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
-
-            for tag, np_fn, fhe_fn in ops:
-                for size in SIZES:
-                    if size > batch_size:
-                        continue
 
+                for size in sizes:
                     # generate vector with dimension (size)
                     a = generate_random_array(rows=size)
 
                     for order_name, order_value in ORDERS:
                         for mode in MODES:
-                            with self.subTest(
-                                op=tag,
-                                order=order_name,
-                                size=size,
-                                mode=mode,
-                                ringDim=p["ringDim"],
-                            ):
-                                result = None
-
-                                try:
-                                    ctv = onp.array(
-                                        cc=cc,
-                                        data=a,
-                                        batch_size=batch_size,
-                                        order=order_value,
-                                        fhe_type="C",
-                                        mode=mode,
-                                        public_key=keys.publicKey,
-                                    )
-
-                                    onp.gen_transpose_keys(keys.secretKey, ctv)
-
-                                    if tag == "scalar_mul":
-                                        expected = np_fn(a, SCALAR)
-                                        ctv_res = fhe_fn(ctv, SCALAR)
-                                    else:
-                                        expected = np_fn(a)
+                            # One encryption serves every op; none of them modify their input
+                            try:
+                                ctv = onp.array(
+                                    cc=cc,
+                                    data=a,
+                                    batch_size=batch_size,
+                                    order=order_value,
+                                    fhe_type="C",
+                                    mode=mode,
+                                    public_key=keys.publicKey,
+                                )
+                                gen_cached_transpose_keys(keys.secretKey, ctv)
+                            except Exception:
+                                self._record_case(
+                                    params={
+                                        "case": "rowmajor_colmajor",
+                                        "stage": "setup",
+                                        "size": size,
+                                        "ringDim": p["ringDim"],
+                                    },
+                                    input_data={"a": a},
+                                )
+                                raise
+
+                            for tag, np_fn, fhe_fn in ops:
+                                with self.subTest(
+                                    op=tag,
+                                    order=order_name,
+                                    size=size,
+                                    mode=mode,
+                                    ringDim=p["ringDim"],
+                                ):
+                                    result = None
+                                    expected = np_fn(a)
+
+                                    try:
                                         ctv_res = fhe_fn(ctv)
 
-                                    # decrypt and compare
-                                    result = ctv_res.decrypt(keys.secretKey, unpack_type="original")
+                                        # decrypt and compare
+                                        result = ctv_res.decrypt(
+                                            keys.secretKey, unpack_type="original"
+                                        )
+
+                                        self.assertArrayClose(actual=result, expected=expected)
+                                    except Exception as e:
+                                        self._record_case(
+                                            params={
+                                                "case": "rowmajor_colmajor",
+                                                "size": size,
+                                                "ringDim": p["ringDim"],
+                                            },
+                                            input_data={"a": a},
+                                            expected=expected,
+                                            result=result,
+                                        )
+                                        raise
+                            del ctv
 
-                                    self.assertArrayClose(actual=result, expected=expected)
-                                except Exception as e:
-                                    self._record_case(
-                                        params={
-                                            "case": "rowmajor_colmajor",
-                                            "size": size,
-                                            "ringDim": p["ringDim"],
-                                        },
-                                        input_data={"a": a},
-                                        expected=expected,
-                                        result=result,
-                                    )
-                                    raise
+    def test_scalar_mul(self):
+        """Multiply vectors of all SIZES packed into one ciphertext, then per vector."""
+        ckks_params = load_ckks_params()
+
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+
+                vectors = [generate_random_array(rows=size) for size in SIZES]
+                ct_a, offsets = encrypt_batch(cc, keys.publicKey, vectors, batch_size)
+                ct_res = ct_a * SCALAR
+                values = ct_res.decrypt(keys.secretKey, unpack_type="raw")
+                del ct_a, ct_res
+                gc.collect()
+
+                for size, a, offset in zip(SIZES, vectors, offsets):
+                    with self.subTest(
+                        op="scalar_mul", size=size, mode="packed", ringDim=p["ringDim"]
+                    ):
+                        expected = a * SCALAR
+                        result = unpack_batch(values, a.shape, offset)
+                        try:
+                            self.assertArrayClose(actual=result, expected=expected)
+                        except Exception:
+                            self._record_case(
+                                params={
+                                    "case": "vector_unary_packed",
+                                    "op": "scalar_mul",
+                                    "size": size,
+                                    "ringDim": p["ringDim"],
+                                },
+                                input_data={"a": a},
+                                expected=expected,
+                                result=result,
+                            )
+                            raise
+
+                for size in UNPACKED_SIZES:
+                    a = generate_random_array(rows=size)
+                    expected = a * SCALAR
+                    with self.subTest(
+                        op="scalar_mul", size=size, mode="zero", ringDim=p["ringDim"]
+                    ):
+                        result = None
+                        try:
+                            ctv = onp.array(
+                                cc=cc,
+                                data=a,
+                                batch_size=batch_size,
+                                fhe_type="C",
+                                mode="zero",
+                                public_key=keys.publicKey,
+                            )
+                            ct_res = ctv * SCALAR
+                            result = ct_res.decrypt(keys.secretKey, unpack_type="original")
+                            self.assertArrayClose(actual=result, expected=expected)
+                        except Exception:
+                            self._record_case(
+                                params={
+                                    "case": "vector_unary",
+                                    "op": "scalar_mul",
+                                    "size": size,
+                                    "ringDim": p["ringDim"],
+                                },
+                                input_data={"a": a},
+                                expected=expected,
+                                result=result,
+                            )
+                            raise
 
 
 class TestVectorBinaryOps(MainUnittest):
-    def test_binary_operations(self):
+    def test_elementwise_operations(self):
+        """Run each element-wise op over all SIZES packed into one ciphertext, then per vector."""
         ops = [
             ("add", lambda x, y: x + y, lambda a, b: onp.add(a, b)),
             ("sub", lambda x, y: x - y, lambda a, b: onp.subtract(a, b)),
             ("mul", lambda x, y: x * y, lambda a, b: onp.multiply(a, b)),
-            ("dot", lambda x, y: np.dot(x, y), lambda a, b: onp.dot(a, b)),
         ]
 
         ckks_params = load_ckks_params()
-        for _, p in enumerate(ckks_params):
-            batch_size = p["ringDim"] // 2
-            cc, keys = gen_crypto_context(p)
-            cc.EvalMultKeyGen(keys.secretKey)
-            cc.EvalSumKeyGen(keys.secretKey)
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
 
-            for tag, np_fn, fhe_fn in ops:
-                for size in SIZES:
-                    if size > batch_size:
-                        continue
+                vectors_a = [generate_random_array(rows=size) for size in SIZES]
+                vectors_b = [generate_random_array(rows=size) for size in SIZES]
+                ct_a, offsets = encrypt_batch(cc, keys.publicKey, vectors_a, batch_size)
+                ct_b, _ = encrypt_batch(cc, keys.publicKey, vectors_b, batch_size)
 
+                for tag, np_fn, fhe_fn in ops:
+                    ct_res = fhe_fn(ct_a, ct_b)
+                    values = ct_res.decrypt(keys.secretKey, unpack_type="raw")
+                    del ct_res
+
+                    for size, a, b, offset in zip(SIZES, vectors_a, vectors_b, offsets):
+                        with self.subTest(op=tag, size=size, mode="packed", ringDim=p["ringDim"]):
+                            expected = np_fn(a, b)
+                            result = unpack_batch(values, a.shape, offset)
+                            try:
+                                self.assertArrayClose(actual=result, expected=expected)
+                            except Exception:
+                                self._record_case(
+                                    params={
+                                        "case": "vector_binary_packed",
+                                        "op": tag,
+                                        "size": size,
+                                        "ringDim": p["ringDim"],
+                                    },
+                                    input_data={"a": a, "b": b},
+                                    expected=expected,
+                                    result=result,
+                                )
+                                raise
+                del ct_a, ct_b
+                gc.collect()
+
+                for size in UNPACKED_SIZES:
                     a = generate_random_array(rows=size)
                     b = generate_random_array(rows=size)
-
-                    for order_name, order_value in ORDERS:
+                    for tag, np_fn, fhe_fn in ops:
                         expected = np_fn(a, b)
-                        for mode in MODES:
-                            with self.subTest(
-                                op=tag,
-                                order=order_name,
-                                size=size,
-                                mode=mode,
-                                ringDim=p["ringDim"],
-                            ):
-                                result = None
-                                try:
-                                    # encrypt matrices
-                                    ctv_a = onp.array(
-                                        cc=cc,
-                                        data=a,
-                                        batch_size=batch_size,
-                                        order=order_value,
-                                        fhe_type="C",
-                                        mode="zero",
-                                        public_key=keys.publicKey,
-                                    )
-                                    ctv_b = onp.array(
-                                        cc=cc,
-                                        data=b,
-                                        batch_size=batch_size,
-                                        order=order_value,
-                                        fhe_type="C",
-                                        mode="zero",
-                                        public_key=keys.publicKey,
-                                    )
-
-                                    ctv_res = fhe_fn(ctv_a, ctv_b)
-
-                                    # decrypt and compare
-                                    result = ctv_res.decrypt(keys.secretKey, unpack_type="original")
-
-                                    self.assertArrayClose(actual=result, expected=expected)
-
-                                except Exception as e:
-                                    self._record_case(
-                                        params={
-                                            "case": "rowmajor_colmajor",
-                                            "size": size,
-                                            "ringDim": p["ringDim"],
-                                        },
-                                        input_data={"a": a, "b": b},
-                                        expected=expected,
-                                        result=result,
-                                    )
-                                    raise
+                        with self.subTest(op=tag, size=size, mode="zero", ringDim=p["ringDim"]):
+                            result = None
+                            try:
+                                ctv_a = onp.array(
+                                    cc=cc,
+                                    data=a,
+                                    batch_size=batch_size,
+                                    fhe_type="C",
+                                    mode="zero",
+                                    public_key=keys.publicKey,
+                                )
+                                ctv_b = onp.array(
+                                    cc=cc,
+                                    data=b,
+                                    batch_size=batch_size,
+                                    fhe_type="C",
+                                    mode="zero",
+                                    public_key=keys.publicKey,
+                                )
+                                ct_res = fhe_fn(ctv_a, ctv_b)
+                                result = ct_res.decrypt(keys.secretKey, unpack_type="original")
+                                self.assertArrayClose(actual=result, expected=expected)
+                            except Exception:
+                                self._record_case(
+                                    params={
+                                        "case": "vector_binary",
+                                        "op": tag,
+                                        "size": size,
+                                        "ringDim": p["ringDim"],
+                                    },
+                                    input_data={"a": a, "b": b},
+                                    expected=expected,
+                                    result=result,
+                                )
+                                raise
+
+    def test_binary_operations(self):
+        ops = [
+            ("dot", lambda x, y: np.dot(x, y), lambda a, b: onp.dot(a, b)),
+        ]
+
+        ckks_params = load_ckks_params()
+        for group in group_params_by_context(ckks_params):
+            cc, keys = get_cached_crypto_context(group[0])
+            for p in group:
+                batch_size = p["ringDim"] // 2
+                sizes = [size for size in SIZES if size <= batch_size]
+
+                for tag, np_fn, fhe_fn in ops:
+                    for size in sizes:
+                        a = generate_random_array(rows=size)
+                        b = generate_random_array(rows=size)
+
+                        for order_name, order_value in ORDERS:
+                            expected = np_fn(a, b)
+                            for mode in MODES:
+                                with self.subTest(
+                                    op=tag,
+                                    order=order_name,
+                                    size=size,
+                                    mode=mode,
+                                    ringDim=p["ringDim"],
+                                ):
+                                    result = None
+                                    try:
+                                        # encrypt matrices
+                                        ctv_a = onp.array(
+                                            cc=cc,
+                                            data=a,
+                                            batch_size=batch_size,
+                                            order=order_value,
+                                            fhe_type="C",
+                                            mode="zero",
+                                            public_key=keys.publicKey,
+                                        )
+                                        ctv_b = onp.array(
+                                            cc=cc,
+                                            data=b,
+                                            batch_size=batch_size,
+                                            order=order_value,
+                                            fhe_type="C",
+                                            mode="zero",
+                                            public_key=keys.publicKey,
+                                        )
+
+                                        ctv_res = fhe_fn(ctv_a, ctv_b)
+
+                                        # decrypt and compare
+                                        result = ctv_res.decrypt(
+                                            keys.secretKey, unpack_type="original"
+                                        )
+
+                                        self.assertArrayClose(actual=result, expected=expected)
+
+                                    except Exception as e:
+                                        self._record_case(
+                                            params={
+                                                "case": "rowmajor_colmajor",
+                                                "size": size,
+                                                "ringDim": p["ringDim"],
+                                            },
+                                            input_data={"a": a, "b": b},
+                                            expected=expected,
+                                            result=result,
+                                        )
+                                        raise
@@ -1,6 +1,19 @@
 from .utils import generate_random_array
-from .crypto_context import load_ckks_params, gen_crypto_context
+from .packing import encrypt_batch, unpack_batch
+from .crypto_context import (
+    load_ckks_params,
+    group_params_by_context,
+    gen_crypto_context,
+    get_cached_crypto_context,
+    get_cached_sum_row_keys,
+    get_cached_sum_col_keys,
+    gen_cached_accumulate_rows_key,
+    gen_cached_accumulate_cols_key,
+    gen_cached_transpose_keys,
+    gen_cached_square_matmult_key,
+)
 from .case import MainUnittest
+from .reduction import ReductionTestMixin
 from .runner import QuietRunner
 from .result import MainTextTestResult
 
@@ -9,8 +22,19 @@ from .result import MainTextTestResult
 __all__ = [
     "QuietRunner",
     "MainUnittest",
+    "ReductionTestMixin",
     "MainTextTestResult",
     "generate_random_array",
+    "encrypt_batch",
+    "unpack_batch",
     "load_ckks_params",
+    "group_params_by_context",
     "gen_crypto_context",
+    "get_cached_crypto_context",
+    "get_cached_sum_row_keys",
+    "get_cached_sum_col_keys",
+    "gen_cached_accumulate_rows_key",
+    "gen_cached_accumulate_cols_key",
+    "gen_cached_transpose_keys",
+    "gen_cached_square_matmult_key",
 ]
@@ -95,17 +95,13 @@ class MainUnittest(unittest.TestCase):
         e = np.asarray(expected)
         np.testing.assert_allclose(a, e, rtol=rtol, atol=atol, err_msg=msg)
 
-    def tearDown(self) -> None:
-        """Clean up resources after each test."""
-        gc.collect()
-        super().tearDown()
-
     @classmethod
     def tearDownClass(cls) -> None:
-        """Report RSS to stderr for the test runner to parse.
+        """Collect garbage once per class and report RSS to stderr for the test runner to parse.
         Uses /proc/self/status (Linux). Silently skipped on other platforms.
         No external dependencies required.
         """
+        gc.collect()
         try:
             with open("/proc/self/status") as f:
                 for line in f:
@@ -36,11 +36,19 @@ and generating OpenFHE crypto contexts with proper caching support.
 """
 
 import csv
+import functools
+import hashlib
+import os
+import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from openfhe import (
+    BINARY,
     CCParamsCKKSRNS,
+    DeserializeCryptoContext,
+    DeserializePrivateKey,
+    DeserializePublicKey,
     GenCryptoContext,
     PKESchemeFeature,
     UNIFORM_TERNARY,
@@ -54,7 +62,9 @@ from openfhe import (
     HEStd_192_classic,
     HEStd_256_classic,
     HEStd_NotSet,
+    SerializeToFile,
 )
+import openfhe_numpy as onp
 
 
 # ==============================================================================
@@ -79,8 +89,24 @@ _CONVERTERS: Dict[str, Any] = {
     "standardDeviation": float,
 }
 
-# Global cache for crypto contexts to avoid regeneration
-CRYPTO_CONTEXT_CACHE: Dict[Tuple[Tuple[str, Any], ...], Tuple[Any, Any]] = {}
+# Scheme features enabled on every generated context
+_REQUIRED_FEATURES: Tuple[Any, ...] = (
+    PKESchemeFeature.PKE,
+    PKESchemeFeature.LEVELEDSHE,
+    PKESchemeFeature.ADVANCEDSHE,
+)
+
+# Global caches for crypto contexts and their keys to avoid regeneration
+CRYPTO_CONTEXT_CACHE: Dict[Tuple[Any, ...], Any] = {}
+KEYS_CACHE: Dict[int, Any] = {}
+SUM_KEYS_CACHE: Dict[Tuple[Any, ...], Any] = {}
+GENERATED_KEYS: Set[Tuple[Any, ...]] = set()
+
+# Environment variable naming a directory where generated contexts and keys
+# are serialized, so later test runs can load them instead of regenerating
+CC_CACHE_DIR_ENV: str = "OPENFHE_CC_CACHE_DIR"
+# Bumped when the on-disk layout changes so stale entries are ignored
+_DISK_CACHE_VERSION: int = 2
 
 
 # ==============================================================================
@@ -110,6 +136,31 @@ KEY_SWITCH_TECHNIQUE_MAP: Dict[str, Any] = {
     "BV": BV,
 }
 
+# (parameter key, CCParamsCKKSRNS setter, name-to-enum map or None), in the
+# order the setters are applied
+_PARAM_SPEC: Tuple[Tuple[str, str, Optional[Dict[str, Any]]], ...] = (
+    # Basic parameters
+    ("ringDim", "SetRingDim", None),
+    ("multiplicativeDepth", "SetMultiplicativeDepth", None),
+    ("scalingModSize", "SetScalingModSize", None),
+    ("batchSize", "SetBatchSize", None),
+    ("firstModSize", "SetFirstModSize", None),
+    ("standardDeviation", "SetStandardDeviation", None),
+    # Algorithm choices
+    ("secretKeyDist", "SetSecretKeyDist", SECRET_KEY_DIST_MAP),
+    ("scalTech", "SetScalingTechnique", SCALING_TECHNIQUE_MAP),
+    ("ksTech", "SetKeySwitchTechnique", KEY_SWITCH_TECHNIQUE_MAP),
+    ("securityLevel", "SetSecurityLevel", SECURITY_LEVEL_MAP),
+    # Advanced parameters
+    ("numLargeDigits", "SetNumLargeDigits", None),
+    ("maxRelinSkDeg", "SetMaxRelinSkDeg", None),
+    ("digitSize", "SetDigitSize", None),
+)
+
+# Parameters read by gen_crypto_context; anything else in a parameter set
+# (e.g. ptModulus) does not change the generated context
+_CONTEXT_RELEVANT_KEYS: Tuple[str, ...] = tuple(key for key, _, _ in _PARAM_SPEC)
+
 
 # ==============================================================================
 # Parameter Loading Functions
@@ -120,13 +171,41 @@ def load_ckks_params() -> List[Dict[str, Any]]:
     """
     Load and parse CKKS parameter sets from CSV file.
 
+    The CSV is parsed once per process; each call returns fresh copies so
+    callers may modify the dictionaries.
+
     Returns:
-        List of parameter dictionaries with converted types.
+        List of parameter dictionaries with converted types, ordered by
+        ring dimension (stable) so the cheapest sets run first.
 
     Raises:
         FileNotFoundError: If the CSV file is not found.
         ValueError: If parameter conversion fails.
     """
+    return [dict(entry) for entry in _read_params_csv()]
+
+
+def _context_key(params: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the values of the parameters that determine the generated context."""
+    return tuple(params[k] for k in _CONTEXT_RELEVANT_KEYS)
+
+
+def group_params_by_context(params_list: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Group parameter sets that generate the same crypto context.
+
+    Groups keep the order of their first member and every set is kept, so
+    callers can build one context per group and run each set under it.
+    """
+    groups: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+    for params in params_list:
+        groups.setdefault(_context_key(params), []).append(params)
+    return list(groups.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _read_params_csv() -> Tuple[Dict[str, Any], ...]:
+    """Parse PARAMS_CSV into typed parameter dictionaries."""
     if not PARAMS_CSV.exists():
         raise FileNotFoundError(f"Missing CSV file: {PARAMS_CSV}")
 
@@ -149,7 +228,8 @@ def load_ckks_params() -> List[Dict[str, Any]]:
 
             params_list.append(entry)
 
-    return params_list
+    # Cost grows with ringDim; run cheap sets first so failures surface early
+    return tuple(sorted(params_list, key=lambda entry: entry["ringDim"]))
 
 
 # ==============================================================================
@@ -157,57 +237,143 @@ def load_ckks_params() -> List[Dict[str, Any]]:
 # ==============================================================================
 
 
-def gen_crypto_context(params: Dict[str, Any]) -> Tuple[Any, Any]:
+def _build_context(params: Dict[str, Any]) -> Any:
     """
-    Generate a new CryptoContext and key pair from parameters.
+    Generate a new CryptoContext with the required features enabled.
 
     Args:
         params: Dictionary containing CKKS parameters.
 
     Returns:
-        Tuple of (crypto_context, keys).
+        The crypto context (no keys generated).
     """
-    # Create CKKS parameter object
+    # Create CKKS parameter object and apply every setter from the spec
     p = CCParamsCKKSRNS()
-
-    # Set basic parameters
-    p.SetRingDim(params["ringDim"])
-    p.SetMultiplicativeDepth(params["multiplicativeDepth"])
-    p.SetScalingModSize(params["scalingModSize"])
-    p.SetBatchSize(params["batchSize"])
-    p.SetFirstModSize(params["firstModSize"])
-    p.SetStandardDeviation(params["standardDeviation"])
-
-    # Set algorithm choices
-    p.SetSecretKeyDist(SECRET_KEY_DIST_MAP[params["secretKeyDist"]])
-    p.SetScalingTechnique(SCALING_TECHNIQUE_MAP[params["scalTech"]])
-    p.SetKeySwitchTechnique(KEY_SWITCH_TECHNIQUE_MAP[params["ksTech"]])
-    p.SetSecurityLevel(SECURITY_LEVEL_MAP[params["securityLevel"]])
-
-    # Set advanced parameters
-    p.SetNumLargeDigits(params["numLargeDigits"])
-    p.SetMaxRelinSkDeg(params["maxRelinSkDeg"])
-    p.SetDigitSize(params["digitSize"])
+    for key, setter, value_map in _PARAM_SPEC:
+        value = params[key]
+        getattr(p, setter)(value_map[value] if value_map is not None else value)
 
     # Generate crypto context
     cc = GenCryptoContext(p)
 
     # Enable required features
-    required_features = [
-        PKESchemeFeature.PKE,
-        PKESchemeFeature.LEVELEDSHE,
-        PKESchemeFeature.ADVANCEDSHE,
-    ]
-
-    for feat in required_features:
+    for feat in _REQUIRED_FEATURES:
         cc.Enable(feat)
 
-    # Generate keys
+    return cc
+
+
+def _build_keys(cc: Any) -> Any:
+    """
+    Generate a key pair plus the multiplication and sum keys for a context.
+
+    Args:
+        cc: Crypto context to generate keys for.
+
+    Returns:
+        The generated key pair.
+    """
     keys = cc.KeyGen()
     cc.EvalMultKeyGen(keys.secretKey)
     cc.EvalSumKeyGen(keys.secretKey)
+    return keys
 
-    return cc, keys
+
+def gen_crypto_context(params: Dict[str, Any]) -> Tuple[Any, Any]:
+    """
+    Generate a new CryptoContext and key pair from parameters.
+
+    Args:
+        params: Dictionary containing CKKS parameters.
+
+    Returns:
+        Tuple of (crypto_context, keys).
+    """
+    cc = _build_context(params)
+    return cc, _build_keys(cc)
+
+
+class _KeyPair(NamedTuple):
+    """Key pair restored from disk, mirroring openfhe.KeyPair attributes."""
+
+    publicKey: Any
+    secretKey: Any
+
+
+def _disk_cache_path(key: Tuple[Any, ...]) -> Optional[Path]:
+    """Return the directory for a cached context, or None if disabled."""
+    cache_dir = os.getenv(CC_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    # Versioned so entries written before the eval keys were serialized per
+    # key tag, which hold the keys of unrelated contexts, are not reused
+    tagged_key = repr((_DISK_CACHE_VERSION, key)).encode()
+    digest = hashlib.blake2b(tagged_key, digest_size=16).hexdigest()
+    return Path(cache_dir) / f"cc_{digest}"
+
+
+def _load_from_disk(path: Path) -> Optional[Tuple[Any, Any]]:
+    """
+    Deserialize a context and its keys, or return None if unavailable.
+
+    The eval keys were serialized for the stored secret key's tag only. On
+    any failure nothing is registered in the Python caches; the caller then
+    builds a fresh context and keys.
+    """
+    if not path.is_dir():
+        return None
+
+    try:
+        cc, ok = DeserializeCryptoContext(str(path / "cc"), BINARY)
+        if not ok:
+            return None
+        public_key, ok = DeserializePublicKey(str(path / "pk"), BINARY)
+        if not ok:
+            return None
+        secret_key, ok = DeserializePrivateKey(str(path / "sk"), BINARY)
+        if not ok:
+            return None
+        if not cc.DeserializeEvalMultKey(str(path / "mult"), BINARY):
+            return None
+        if not cc.DeserializeEvalAutomorphismKey(str(path / "sum"), BINARY):
+            return None
+    except Exception:
+        return None
+
+    return cc, _KeyPair(public_key, secret_key)
+
+
+def _save_to_disk(path: Path, cc: Any, keys: Any) -> None:
+    """
+    Serialize a context and its keys; a failed write only skips the cache.
+
+    Files are written to a private directory that is then renamed into place,
+    so concurrent test processes never load a context and keys from
+    different generations.
+    """
+    if path.exists():
+        return
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    key_tag = keys.secretKey.GetKeyTag()
+    try:
+        tmp.mkdir(parents=True, exist_ok=True)
+        ok = (
+            SerializeToFile(str(tmp / "cc"), cc, BINARY)
+            and SerializeToFile(str(tmp / "pk"), keys.publicKey, BINARY)
+            and SerializeToFile(str(tmp / "sk"), keys.secretKey, BINARY)
+            # Without the tag OpenFHE writes the keys of every context in
+            # the process, not just the ones for this secret key
+            and cc.SerializeEvalMultKey(str(tmp / "mult"), BINARY, key_tag)
+            and cc.SerializeEvalAutomorphismKey(str(tmp / "sum"), BINARY, key_tag)
+        )
+        if ok:
+            os.replace(tmp, path)
+    except OSError:
+        # Another process published this context first
+        pass
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
 
 
 def get_cached_crypto_context(
@@ -216,6 +382,10 @@ def get_cached_crypto_context(
     """
     Get a cached CryptoContext or generate a new one.
 
+    The context and its keys are cached separately, so keys are generated
+    at most once per cached context. If OPENFHE_CC_CACHE_DIR is set, contexts
+    are also serialized there and loaded by other test processes and runs.
+
     Args:
         params: Dictionary containing CKKS parameters.
         use_cache: Whether to use caching (default: True).
@@ -226,7 +396,88 @@ def get_cached_crypto_context(
     if not use_cache:
         return gen_crypto_context(params)
 
-    # Create cache key from sorted parameters
-    key = tuple(sorted(params.items()))
+    # Key only on fields that affect the context, so parameter sets that
+    # differ in unrelated entries share one context
+    key = _context_key(params)
+
+    cc = CRYPTO_CONTEXT_CACHE.get(key)
+    disk_path = None
+    if cc is None:
+        disk_path = _disk_cache_path(key)
+        loaded = _load_from_disk(disk_path) if disk_path is not None else None
+        if loaded is not None:
+            cc, keys = loaded
+            CRYPTO_CONTEXT_CACHE[key] = cc
+            KEYS_CACHE[id(cc)] = keys
+            return cc, keys
+        cc = CRYPTO_CONTEXT_CACHE[key] = _build_context(params)
+
+    # Cached contexts are never evicted, so id(cc) is stable
+    keys = KEYS_CACHE.get(id(cc))
+    if keys is None:
+        keys = KEYS_CACHE[id(cc)] = _build_keys(cc)
+
+    if disk_path is not None:
+        _save_to_disk(disk_path, cc, keys)
+
+    return cc, keys
+
+
+def _key_tag(secret_key: Any) -> str:
+    """
+    Return a stable identity for a secret key.
+
+    keys.secretKey builds a new Python wrapper on each access, so id() of it
+    is neither stable for one key nor unique across keys; the OpenFHE key tag
+    is both.
+    """
+    return secret_key.GetKeyTag()
+
+
+def get_cached_sum_row_keys(secret_key: Any, ncols: int, slots: int) -> Any:
+    """Get row-summation keys, generating them once per (key tag, ncols, slots)."""
+    cache_key = ("rows", _key_tag(secret_key), ncols, slots)
+    if cache_key not in SUM_KEYS_CACHE:
+        SUM_KEYS_CACHE[cache_key] = onp.sum_row_keys(secret_key, ncols, slots)
+    return SUM_KEYS_CACHE[cache_key]
+
+
+def get_cached_sum_col_keys(secret_key: Any, ncols: int) -> Any:
+    """Get column-summation keys, generating them once per (key tag, ncols)."""
+    cache_key = ("cols", _key_tag(secret_key), ncols)
+    if cache_key not in SUM_KEYS_CACHE:
+        SUM_KEYS_CACHE[cache_key] = onp.sum_col_keys(secret_key, ncols)
+    return SUM_KEYS_CACHE[cache_key]
+
+
+def gen_cached_accumulate_rows_key(secret_key: Any, ncols: int) -> None:
+    """Generate cumulative row-sum keys unless already done for (key tag, ncols)."""
+    cache_key = ("accumulate_rows", _key_tag(secret_key), ncols)
+    if cache_key not in GENERATED_KEYS:
+        onp.gen_accumulate_rows_key(secret_key, ncols)
+        GENERATED_KEYS.add(cache_key)
+
+
+def gen_cached_accumulate_cols_key(secret_key: Any, ncols: int) -> None:
+    """Generate cumulative column-sum keys unless already done for (key tag, ncols)."""
+    cache_key = ("accumulate_cols", _key_tag(secret_key), ncols)
+    if cache_key not in GENERATED_KEYS:
+        onp.gen_accumulate_cols_key(secret_key, ncols)
+        GENERATED_KEYS.add(cache_key)
+
+
+def gen_cached_transpose_keys(secret_key: Any, ctm: Any) -> None:
+    """Generate transpose keys unless already done for (key tag, ncols)."""
+    ncols = 1 if ctm.ndim == 1 else ctm.ncols
+    cache_key = ("transpose", _key_tag(secret_key), ncols)
+    if cache_key not in GENERATED_KEYS:
+        onp.gen_transpose_keys(secret_key, ctm)
+        GENERATED_KEYS.add(cache_key)
+
 
-    return CRYPTO_CONTEXT_CACHE[key]
+def gen_cached_square_matmult_key(secret_key: Any, size: int) -> None:
+    """Generate square matrix product keys unless already done for (key tag, size)."""
+    cache_key = ("square_matmult", _key_tag(secret_key), size)
+    if cache_key not in GENERATED_KEYS:
+        onp.EvalSquareMatMultRotateKeyGen(secret_key, size)
+        GENERATED_KEYS.add(cache_key)
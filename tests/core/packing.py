@@ -0,0 +1,88 @@
+# ==============================================================================
+#  BSD 2-Clause License
+#
+#  Copyright (c) 2014-2025, NJIT, Duality Technologies Inc. and other contributors
+#
+#  All rights reserved.
+#
+#  Author TPOC: contact@openfhe.org
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#  1. Redistributions of source code must retain the above copyright notice, this
+#     list of conditions and the following disclaimer.
+#
+#  2. Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+#  FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+#  DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+#  SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+#  OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+#  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# =============================================================================
+"""
+Slot packing helpers for OpenFHE-NumPy tests.
+
+Element-wise operations act on every slot independently, so several small
+test inputs can share one ciphertext and be checked with a single
+encrypt/evaluate/decrypt round trip.
+"""
+
+import math
+
+import numpy as np
+import openfhe_numpy as onp
+
+
+def _padded_shape(shape):
+    return tuple(onp.next_power_of_two(dim) for dim in shape)
+
+
+def encrypt_batch(cc, public_key, arrays, batch_size):
+    """Encrypt several arrays into disjoint slot ranges of one ciphertext.
+
+    Each array is zero-padded to power-of-two dimensions and flattened
+    row-major, so element-wise operations on the packed ciphertext act on
+    every array at once.
+
+    Returns:
+        Tuple of (ciphertext, offsets) where offsets[i] is the first slot
+        of arrays[i].
+    """
+    blocks = []
+    offsets = []
+    offset = 0
+    for arr in arrays:
+        block = np.zeros(_padded_shape(arr.shape))
+        block[tuple(slice(0, dim) for dim in arr.shape)] = arr
+        blocks.append(block.ravel())
+        offsets.append(offset)
+        offset += block.size
+
+    if offset > batch_size:
+        raise ValueError(f"Packed arrays need {offset} slots, batch size is {batch_size}")
+
+    ct = onp.array(
+        cc=cc,
+        data=np.concatenate(blocks),
+        batch_size=batch_size,
+        fhe_type="C",
+        mode="zero",
+        public_key=public_key,
+    )
+    return ct, offsets
+
+
+def unpack_batch(values, shape, offset):
+    """Extract one array of the given shape from a packed slot vector."""
+    padded = _padded_shape(shape)
+    block = np.asarray(values[offset : offset + math.prod(padded)])
+    return block.reshape(padded)[tuple(slice(0, dim) for dim in shape)]
@@ -0,0 +1,123 @@
+# ==============================================================================
+#  BSD 2-Clause License
+#
+#  Copyright (c) 2014-2025, NJIT, Duality Technologies Inc. and other contributors
+#
+#  All rights reserved.
+#
+#  Author TPOC: contact@openfhe.org
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#  1. Redistributions of source code must retain the above copyright notice, this
+#     list of conditions and the following disclaimer.
+#
+#  2. Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+#  FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+#  DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+#  SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+#  OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+#  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# =============================================================================
+"""
+Shared body for matrix reduction tests (sum, mean) in OpenFHE-NumPy.
+
+Test classes mix in ReductionTestMixin next to MainUnittest and call
+_run_reduction with the NumPy and OpenFHE-NumPy reducers to compare.
+"""
+
+import functools
+
+import openfhe_numpy as onp
+
+from .crypto_context import (
+    get_cached_crypto_context,
+    get_cached_sum_col_keys,
+    get_cached_sum_row_keys,
+    load_ckks_params,
+)
+from .utils import generate_random_array
+
+
+class ReductionTestMixin:
+    """Run a reduction over every parameter set, size and packing order."""
+
+    SIZES = (2, 3, 8, 16)
+    ORDERS = (("row_major", onp.ROW_MAJOR), ("col_major", onp.COL_MAJOR))
+    MIN_DEPTH = 3
+
+    @classmethod
+    def _supported_sizes(cls, ring_dim):
+        """Sizes a parameter set can run; small rings lose accuracy above 2x2."""
+        return [
+            size
+            for size in cls.SIZES
+            if size <= ring_dim // 2 and (ring_dim >= 4096 or size <= 2)
+        ]
+
+    @staticmethod
+    def _attach_sum_keys(ctm, keys, axis, order_value):
+        """Attach the rotation keys an axis reduction needs for this layout."""
+        # Reducing over the stored rows of the slot layout needs row keys
+        stored_axis = axis if order_value == onp.ROW_MAJOR else 1 - axis
+        width = ctm.ncols if order_value == onp.ROW_MAJOR else ctm.nrows
+        if stored_axis == 0:
+            ctm.extra["rowkey"] = get_cached_sum_row_keys(keys.secretKey, width, ctm.batch_size)
+        else:
+            ctm.extra["colkey"] = get_cached_sum_col_keys(keys.secretKey, width)
+
+    def _run_reduction(self, case, np_fn, onp_fn, axis=None):
+        """Compare onp_fn(ctm, axis) against np_fn(A, axis) for every case."""
+        ckks_params = load_ckks_params()
+
+        for p in ckks_params:
+            depth = max(p.get("multiplicativeDepth", 0), self.MIN_DEPTH)
+            params = {**p, "multiplicativeDepth": depth}
+            batch_size = params["ringDim"] // 2
+            sizes = self._supported_sizes(params["ringDim"])
+            if not sizes:
+                continue
+            cc, keys = get_cached_crypto_context(params)
+            encrypt = functools.partial(
+                onp.array, cc=cc, batch_size=batch_size, fhe_type="C", public_key=keys.publicKey
+            )
+
+            for size in sizes:
+                A = generate_random_array(rows=size, cols=size)
+                expected = np_fn(A, axis=axis)
+
+                for order_name, order_value in self.ORDERS:
+                    with self.subTest(order=order_name, size=size, ringDim=params["ringDim"]):
+                        result = None
+                        ctm = None
+                        ctm_result = None
+                        try:
+                            ctm = encrypt(data=A, order=order_value, mode="zero")
+                            if axis is not None:
+                                self._attach_sum_keys(ctm, keys, axis, order_value)
+                            ctm_result = onp_fn(ctm, axis=axis)
+                            result = ctm_result.decrypt(keys.secretKey, unpack_type="original")
+                            self.assertArrayClose(actual=result, expected=expected)
+                        except Exception:
+                            self._record_case(
+                                params={
+                                    "case": case,
+                                    "size": size,
+                                    "ringDim": p["ringDim"],
+                                },
+                                input_data={"A": A},
+                                expected=expected,
+                                result=result,
+                            )
+                            raise
+                        finally:
+                            del ctm, ctm_result, result
@@ -35,17 +35,32 @@ This module extends unittest's TextTestResult to provide detailed error reportin
 with test parameter information, subtest tracking, and optional debug output.
 """
 
+import itertools
 import os
 from typing import Any, Optional, Tuple
 from unittest import TextTestResult
 import numpy as np
 
+# Detail (verbose) mode requested by the test runner via the environment
+_DETAIL_MODE = os.getenv("DETAILS", "0") == "1"
+
+# Case data recorded on the test instance by MainUnittest._record_case
+_CASE_ATTRS = ("params", "input_data", "expected", "result")
+
 
 class MainTextTestResult(TextTestResult):
     """
     Enhanced test result handler with detailed error reporting and subtest tracking.
     """
 
+    __slots__ = (
+        "detail_mode",
+        "subtests_total",
+        "subtests_pass",
+        "subtests_failures",
+        "subtests_errors",
+    )
+
     def __init__(self, *args, debug: bool = False, **kwargs):
         """Initialize the test result handler.
 
@@ -56,7 +71,7 @@ class MainTextTestResult(TextTestResult):
         super().__init__(*args, **kwargs)
 
         # Enable detail (verbose) via environment variable or parameter
-        self.detail_mode = os.getenv("DETAILS", "0") == "1" or debug
+        self.detail_mode = _DETAIL_MODE or debug
 
         # Initialize subtest counters
         self.subtests_total = 0
@@ -115,12 +130,10 @@ class MainTextTestResult(TextTestResult):
         """
         exc_class, exc, _ = err
 
-        # Extract test information
+        # Extract test information; recorded case data lives in the instance dict
         test_name = getattr(test, "_testMethodName", "<unknown>")
-        params = getattr(test, "params", {})
-        input_data = getattr(test, "input_data", None)
-        expected = getattr(test, "expected", None)
-        result = getattr(test, "result", None)
+        state = getattr(test, "__dict__", {})
+        params, input_data, expected, result = (state.get(k) for k in _CASE_ATTRS)
 
         # Extract subtest information if available
         subtest_params = getattr(subtest, "params", None) if subtest else None
@@ -164,12 +177,26 @@ class MainTextTestResult(TextTestResult):
             cls_name = value.__class__.__name__
 
             if value.size <= 8:
-                return np.array2string(value, separator=", ")
+                return repr(value.tolist())
             else:
                 # Show first few elements as preview
-                preview = ", ".join(map(str, value.flat[:3]))
+                # islice over .flat avoids copying non-contiguous views
+                head = [
+                    x.item() if isinstance(x, np.generic) else x
+                    for x in itertools.islice(value.flat, 3)
+                ]
+                if np.issubdtype(value.dtype, np.number):
+                    preview = ", ".join(f"{x:.6g}" for x in head)
+                else:
+                    preview = ", ".join(map(repr, head))
                 return f"{cls_name}(shape={value.shape}, preview=[{preview}, ...])"
 
+        # --- Handle sequences without rendering every element ---
+        if isinstance(value, (list, tuple)) and len(value) > 8:
+            cls_name = value.__class__.__name__
+            preview = ", ".join(self._format_value(v) for v in value[:3])
+            return f"{cls_name}(len={len(value)}, preview=[{preview}, ...])"
+
         # --- Fallback for all other values ---
         str_val = str(value)
         if len(str_val) > 30:
@@ -30,14 +30,31 @@
 # =============================================================================
 
 
+import functools
+
 import numpy as np
 
+# Shared generator for unseeded draws; seeding a new PCG64 per call is costly
+_DEFAULT_RNG = np.random.default_rng()
+
+
+def _array_size(rows, cols):
+    return rows if cols is None else (rows, cols)
+
+
+@functools.lru_cache(maxsize=128)
+def _seeded_random_array(rows, cols, low, high, seed):
+    """Seeded draws are deterministic, so they are cached read-only."""
+    arr = np.random.default_rng(seed).uniform(low, high, size=_array_size(rows, cols))
+    arr.setflags(write=False)
+    return arr
+
 
 def generate_random_array(rows, cols=None, low=0, high=10, seed=None):
-    """Generate random array; returns a 1D vector if cols is None or 1."""
-    rng = np.random.default_rng(seed)
-    if cols is None:
-        size = rows  # 1D vector
-    else:
-        size = (rows, cols)  # 2D matrix
-    return np.array(rng.uniform(low, high, size=size))
+    """Generate random array; returns a 1D vector if cols is None.
+
+    Arrays generated with a seed are memoized and returned read-only.
+    """
+    if seed is None:
+        return _DEFAULT_RNG.uniform(low, high, size=_array_size(rows, cols))
+    return _seeded_random_array(rows, cols, low, high, seed)
@@ -3,13 +3,25 @@ Test runner for OpenFHE-NumPy test suite.
 """
 
 import argparse
+import fnmatch
+import functools
+import hashlib
+import importlib
+import json
 import os
+import queue
+import re
 import subprocess
 import sys
+import sysconfig
+import tempfile
+import threading
 import time
 from pathlib import Path
+from types import ModuleType
 from collections import defaultdict
-from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import unittest
 
 try:
@@ -22,12 +34,20 @@ PROJECT_ROOT = Path(__file__).parent.resolve()
 CASES_DIR = PROJECT_ROOT / "cases"
 DEFAULT_PATTERN = "test_*.py"
 DEFAULT_TIMEOUT = 7200  # seconds (2 hours)
+CC_CACHE_DIR_ENV = "OPENFHE_CC_CACHE_DIR"  # read by core.crypto_context
+# Kept out of the source tree; one file per checkout
+DISCOVER_CACHE = Path(tempfile.gettempdir()) / (
+    "openfhe_numpy_discover_"
+    + hashlib.blake2b(str(PROJECT_ROOT).encode(), digest_size=8).hexdigest()
+    + ".json"
+)
 
 # Exit codes
 EXIT_PASS = 0
 EXIT_FAIL = 1
 EXIT_TIMEOUT = 2
 EXIT_KILLED = 3
+EXIT_NOT_RUN = 4  # --failfast stopped the file before this test
 
 
 # --- Command Line Interface ---------------------------------------------------
@@ -60,6 +80,19 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_TIMEOUT,
         help=f"Timeout per test in seconds (default: {DEFAULT_TIMEOUT})",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of test subprocesses to run in parallel; 0 = half the CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--no-isolate",
+        dest="isolate",
+        action="store_false",
+        help="Run each test file in one subprocess instead of one per test",
+    )
     parser.add_argument(
         "-x",
         "--exitfirst",
@@ -102,6 +135,16 @@ def _fmt_cpu(cpu_time: float, wall_time: float) -> str:
 
 
 # --- Test Discovery -----------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _all_test_files(pattern: str) -> Tuple[Path, ...]:
+    """Collect files under CASES_DIR whose name matches pattern in one walk."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(CASES_DIR):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        found.extend(Path(dirpath) / name for name in fnmatch.filter(filenames, pattern))
+    return tuple(sorted(found))
+
+
 def find_tests(target: Optional[str] = None, pattern: str = DEFAULT_PATTERN) -> List[Path]:
     """
     Find test files matching the given pattern.
@@ -116,11 +159,17 @@ def find_tests(target: Optional[str] = None, pattern: str = DEFAULT_PATTERN) ->
     Raises:
         SystemExit: If target is specified but not found.
     """
+    # Name-only patterns are matched against one cached walk of CASES_DIR
+    # shared by every target; patterns with directories fall back to rglob
+    name_only = "/" not in pattern and os.sep not in pattern
+
     if target is None:
-        return sorted(CASES_DIR.rglob(pattern))
+        return list(_all_test_files(pattern)) if name_only else sorted(CASES_DIR.rglob(pattern))
 
     target_path = CASES_DIR / target
     if target_path.is_dir():
+        if name_only:
+            return [p for p in _all_test_files(pattern) if p.is_relative_to(target_path)]
         return sorted(target_path.rglob(pattern))
     if target_path.is_file():
         return [target_path]
@@ -144,24 +193,111 @@ def module_from_path(pyfile: Path) -> str:
 
 
 # --- Unittest ID helpers ------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def find_test_classes(module: ModuleType) -> Tuple[type, ...]:
+    """
+    Return the MainUnittest subclasses defined in a module.
+
+    Walks the MainUnittest subclass tree rather than scanning every module
+    global; test files do `from openfhe import *`, so their namespaces are large.
+    Module contents do not change during a run, so results are cached per module.
+    """
+    from core import MainUnittest
+
+    found: List[type] = []
+    seen: Set[type] = set()
+    pending = list(MainUnittest.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        # A class with several MainUnittest bases is reachable more than once
+        if cls in seen:
+            continue
+        seen.add(cls)
+        if cls.__module__ == module.__name__:
+            found.append(cls)
+        pending.extend(cls.__subclasses__())
+    return tuple(found)
+
+
 def get_test_from_module(module_name: str) -> List[str]:
     """
     Return full unittest IDs like:
       package.module.ClassName.test_method
     """
+    module = importlib.import_module(module_name)
     loader = unittest.TestLoader()
-    suite = loader.loadTestsFromName(module_name)
-    ids: List[str] = []
+    ids = [
+        f"{module_name}.{cls.__name__}.{meth}"
+        for cls in find_test_classes(module)
+        for meth in loader.getTestCaseNames(cls)
+    ]
+    return sorted(ids)
 
-    def walk(suite_obj: unittest.TestSuite) -> None:
-        for t in suite_obj:
-            if isinstance(t, unittest.TestSuite):
-                walk(t)
-            else:
-                ids.append(t.id())
 
-    walk(suite)
-    return sorted(ids)
+@functools.lru_cache(maxsize=1)
+def _load_discover_cache() -> Dict[str, Any]:
+    try:
+        with open(DISCOVER_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_discover_cache(cache: Dict[str, Any]) -> None:
+    tmp = DISCOVER_CACHE.with_name(f"{DISCOVER_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+        os.replace(tmp, DISCOVER_CACHE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _loaded_module_mtimes() -> Dict[str, int]:
+    """Return the mtimes of every imported module file outside the stdlib."""
+    paths = sysconfig.get_paths()
+    stdlib = (paths["stdlib"], paths["platstdlib"])
+    site = (paths["purelib"], paths["platlib"])
+    mtimes: Dict[str, int] = {}
+    for mod in list(sys.modules.values()):
+        path = getattr(mod, "__file__", None)
+        if not path or (path.startswith(stdlib) and not path.startswith(site)):
+            continue
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+
+def _is_current(mtimes: Dict[str, int]) -> bool:
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def discover_test_ids(pyfile: Path) -> List[str]:
+    """
+    Return the unittest IDs of a test file, importing it only when needed.
+
+    IDs are cached in DISCOVER_CACHE together with the mtimes of every module
+    loaded when the file was imported (the file itself, core, helpers,
+    openfhe_numpy, ...), so unchanged files are not imported in the runner
+    just to list their tests again. The recorded set is a superset of the
+    file's own imports, which can only cause extra re-imports.
+    """
+    module_name = module_from_path(pyfile)
+
+    cache = _load_discover_cache()
+    entry = cache.get(module_name)
+    if entry is not None and _is_current(entry["mtimes"]):
+        return entry["ids"]
+
+    ids = get_test_from_module(module_name)
+    cache[module_name] = {"mtimes": _loaded_module_mtimes(), "ids": ids}
+    _save_discover_cache(cache)
+    return ids
 
 
 def split_test_id(test_id: str) -> Tuple[str, str, str]:
@@ -203,80 +339,172 @@ def _parse_stderr(raw: str) -> Tuple[Optional[float], str]:
     return rss_bytes, "\n".join(clean_lines)
 
 
+def _core_groups(jobs: int) -> Optional["queue.Queue[Set[int]]"]:
+    """
+    Split the CPUs this process may run on into one disjoint set per job.
+
+    Returns None when affinity is unsupported (e.g. macOS) or there are fewer
+    CPUs than jobs.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    cores = sorted(os.sched_getaffinity(0))
+    per_job = len(cores) // jobs
+    if per_job == 0:
+        return None
+    groups: "queue.Queue[Set[int]]" = queue.Queue()
+    for i in range(jobs):
+        groups.put(set(cores[i * per_job : (i + 1) * per_job]))
+    return groups
+
+
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _emit_child_output(message: str, stdout: Optional[str], stderr: str) -> None:
+    """Print one child's report as a block so parallel children do not interleave."""
+    with _OUTPUT_LOCK:
+        if message:
+            print(message)
+        if stdout:
+            sys.stdout.write(stdout)
+        sys.stdout.flush()
+        if stderr:
+            sys.stderr.write(stderr + "\n")
+            sys.stderr.flush()
+
+
 def _run_command(
-    cmd: List[str], timeout: int, env: Dict[str, str]
-) -> Tuple[int, float, float, Optional[float]]:
+    cmd: List[str],
+    timeout: int,
+    env: Dict[str, str],
+    cpus: Optional[Set[int]] = None,
+    measure_cpu: bool = True,
+) -> Tuple[int, float, Optional[float], Optional[float], str]:
     """
     Execute a command with timeout and return results.
 
+    If cpus is given, the child is pinned to those CPUs so that OpenFHE's
+    threads stay on cores (and caches) not used by other parallel children.
+
+    CPU time is the change in RUSAGE_CHILDREN around the child, which also
+    counts any other child reaped meanwhile; parallel callers pass
+    measure_cpu=False.
+
     Returns:
-        Tuple of (exit_code, wall_seconds, cpu_seconds, rss_bytes).
+        Tuple of (exit_code, wall_seconds, cpu_seconds, rss_bytes, stderr).
         Exit codes:
             0 = pass
             1 = fail
             2 = timeout
             3 = killed by signal (e.g. OOM)
+        cpu_seconds:
+            Child CPU time, or None if not measured or unavailable.
         rss_bytes:
             RSS reported by child via __RSS__: marker, or None if unavailable.
+        stderr:
+            Child stderr without the __RSS__ marker.
     """
-    before_cpu = _get_children_cpu()
+    before_cpu = _get_children_cpu() if measure_cpu else None
     start_time = time.perf_counter()
 
-    def _cpu_delta() -> float:
+    def _cpu_delta() -> Optional[float]:
         if before_cpu is None:
-            return 0.0
+            return None
         after = _get_children_cpu()
         if after is None:
-            return 0.0
+            return None
         return (after[0] - before_cpu[0]) + (after[1] - before_cpu[1])
 
     try:
-        proc = subprocess.run(
+        with subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
             env=env,
-        )
+        ) as proc:
+            if cpus:
+                try:
+                    os.sched_setaffinity(proc.pid, cpus)
+                except OSError:
+                    pass  # child already exited
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                stdout, stderr = proc.communicate()
+                raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
         duration = time.perf_counter() - start_time
         cpu_time = _cpu_delta()
 
-        rss_bytes, clean_stderr = _parse_stderr(proc.stderr)
+        rss_bytes, clean_stderr = _parse_stderr(stderr)
 
         if proc.returncode < 0:
             # Negative return code means killed by a signal (e.g. -9 = SIGKILL/OOM)
-            print(f"Process killed by signal {-proc.returncode} (likely OOM)")
-            if clean_stderr:
-                sys.stderr.write(clean_stderr + "\n")
-            return EXIT_KILLED, duration, cpu_time, rss_bytes
+            _emit_child_output(
+                f"Process killed by signal {-proc.returncode} (likely OOM)", None, clean_stderr
+            )
+            return EXIT_KILLED, duration, cpu_time, rss_bytes, clean_stderr
 
         # Only print output on failure — passing tests stay silent
         if proc.returncode != 0:
-            if proc.stdout:
-                sys.stdout.write(proc.stdout)
-            if clean_stderr:
-                sys.stderr.write(clean_stderr + "\n")
+            _emit_child_output("", stdout, clean_stderr)
 
-        return proc.returncode, duration, cpu_time, rss_bytes
+        return proc.returncode, duration, cpu_time, rss_bytes, clean_stderr
 
     except subprocess.TimeoutExpired as e:
         duration = time.perf_counter() - start_time
-        print(f"Command timed out after {timeout}s")
-        if e.stdout:
-            sys.stdout.write(e.stdout)
-        if e.stderr:
-            rss_bytes, clean_stderr = _parse_stderr(e.stderr)
-            if clean_stderr:
-                sys.stderr.write(clean_stderr + "\n")
-        else:
-            rss_bytes = None
-        return EXIT_TIMEOUT, duration, _cpu_delta(), rss_bytes
+        rss_bytes, clean_stderr = _parse_stderr(e.stderr)
+        _emit_child_output(f"Command timed out after {timeout}s", e.stdout, clean_stderr)
+        return EXIT_TIMEOUT, duration, _cpu_delta(), rss_bytes, clean_stderr
 
     except Exception as e:
         duration = time.perf_counter() - start_time
-        print(f"Command failed with error: {e}")
-        return EXIT_FAIL, duration, _cpu_delta(), None
+        _emit_child_output(f"Command failed with error: {e}", None, "")
+        return EXIT_FAIL, duration, _cpu_delta(), None, ""
+
+
+_FAILURE_HEADER_RE = re.compile(r"^(?:FAIL|ERROR): (\w+) \(([\w.]+)\)", re.MULTILINE)
+
+
+def _split_file_outcome(
+    test_ids: List[str], outcome: Tuple, exit_first: bool = False
+) -> Iterator[Tuple[str, Tuple]]:
+    """
+    Attribute one whole-file unittest run to its individual tests.
+
+    Failing tests are read from unittest's FAIL/ERROR headers. When the run
+    failed without headers, or a header names something that is not one of
+    test_ids (import error, setUpClass error, ...), every test is reported
+    with the file's exit code. Under --failfast, tests after the first
+    failure are reported as not run. Wall and CPU time are split evenly
+    because the child does not time tests individually.
+    """
+    code, duration, cpu_time, rss_bytes, stderr = outcome
+
+    failed = set()
+    for method, where in _FAILURE_HEADER_RE.findall(stderr):
+        # Python >= 3.11 prints the full test id, older versions module.Class
+        failed.add(where if where.endswith("." + method) else f"{where}.{method}")
+
+    attributable = code == EXIT_FAIL and failed and failed.issubset(test_ids)
+    codes = []
+    for test_id in test_ids:
+        if codes and codes[-1] in (EXIT_FAIL, EXIT_NOT_RUN) and attributable and exit_first:
+            codes.append(EXIT_NOT_RUN)
+        elif attributable:
+            codes.append(EXIT_FAIL if test_id in failed else EXIT_PASS)
+        else:
+            codes.append(code)
+    n_tests = sum(test_code != EXIT_NOT_RUN for test_code in codes) or 1
+
+    for test_id, test_code in zip(test_ids, codes):
+        if test_code == EXIT_NOT_RUN:
+            yield test_id, (test_code, 0.0, None, None, "")
+        else:
+            test_cpu = cpu_time / n_tests if cpu_time is not None else None
+            yield test_id, (test_code, duration / n_tests, test_cpu, rss_bytes, "")
 
 
 def run_test_file(
@@ -287,6 +515,8 @@ def run_test_file(
     total: int,
     details: bool,
     exit_first: bool,
+    jobs: int = 1,
+    isolate: bool = True,
 ) -> Tuple[List[Tuple[str, int, float]], Dict[str, Dict[str, Any]], List[str]]:
     if details:
         print(f"\n\n=== Running {pyfile.name} ({current}/{total}) ===")
@@ -296,7 +526,7 @@ def run_test_file(
 
     # Find all tests in this module
     try:
-        test_ids = get_test_from_module(module_name)
+        test_ids = discover_test_ids(pyfile)
     except Exception as e:
         print(f"[discover] Failed to discover tests in '{module_name}': {e}")
         label = f"{pyfile.name}:<discover>"
@@ -319,6 +549,9 @@ def run_test_file(
     env = os.environ.copy()
     env["PYTHONPATH"] = str(PROJECT_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
     env["DETAILS"] = "1" if details else "0"
+    if isolate and jobs > 1:
+        # Parallel children would oversubscribe the CPUs with OpenFHE's OpenMP threads
+        env.setdefault("OMP_NUM_THREADS", "1")
 
     results: List[Tuple[str, int, float]] = []
     class_stats: Dict[str, Dict[str, Any]] = defaultdict(
@@ -327,6 +560,7 @@ def run_test_file(
             "fail": 0,
             "timeout": 0,
             "killed": 0,
+            "not_run": 0,
             "time": 0.0,
             "cpu_time": 0.0,
             "max_rss": 0.0,
@@ -337,58 +571,100 @@ def run_test_file(
     if details:
         print("\n...testing...\n")
 
-    for idx, test_id in enumerate(test_ids, 1):
-        _, cls, meth = split_test_id(test_id)
-        label = f"{pyfile.name}:{cls}.{meth}"
-
-        if details:
-            print(f"  [{idx}/{len(test_ids)}] {label}")
-
+    def _test_cmd(*ids: str) -> List[str]:
         cmd = [sys.executable, "-m", "unittest", "-q"]
         if exit_first:
             cmd.append("--failfast")
-        cmd.append(test_id)
-
-        code, duration, cpu_time, rss_bytes = _run_command(cmd, timeout, env)
-        results.append((label, code, duration))
-
-        class_stats[cls]["time"] += duration
-        class_stats[cls]["cpu_time"] += cpu_time
-        if rss_bytes is not None:
-            class_stats[cls]["max_rss"] = max(class_stats[cls]["max_rss"], rss_bytes)
-
-        if code == EXIT_PASS:
-            class_stats[cls]["pass"] += 1
-        elif code == EXIT_TIMEOUT:
-            class_stats[cls]["timeout"] += 1
-            failed_labels.append(label)
-        elif code == EXIT_KILLED:
-            class_stats[cls]["killed"] += 1
-            failed_labels.append(label)
-        else:
-            class_stats[cls]["fail"] += 1
-            failed_labels.append(label)
+        cmd.extend(ids)
+        return cmd
+
+    # Each test runs in its own subprocess, so tests are independent and can
+    # be launched concurrently; parallel results are handled as they finish so
+    # --exitfirst stops at the first failure rather than the first in order.
+    pool: Optional[ThreadPoolExecutor] = None
+    if not isolate:
+        # One interpreter and one OpenFHE load for the whole file
+        outcomes = _split_file_outcome(
+            test_ids, _run_command(_test_cmd(*test_ids), timeout, env), exit_first
+        )
+    elif jobs > 1:
+        core_groups = _core_groups(jobs)
+
+        def _run_pinned(cmd: List[str]) -> Tuple[int, float, Optional[float], Optional[float], str]:
+            # Per-test CPU is not measured: concurrent children overlap in RUSAGE_CHILDREN
+            if core_groups is None:
+                return _run_command(cmd, timeout, env, measure_cpu=False)
+            cpus = core_groups.get()
+            try:
+                return _run_command(cmd, timeout, env, cpus, measure_cpu=False)
+            finally:
+                core_groups.put(cpus)
+
+        pool = ThreadPoolExecutor(max_workers=jobs)
+        futures = {pool.submit(_run_pinned, _test_cmd(tid)): tid for tid in test_ids}
+        outcomes = ((futures[future], future.result()) for future in as_completed(futures))
+    else:
+        outcomes = ((tid, _run_command(_test_cmd(tid), timeout, env)) for tid in test_ids)
+
+    try:
+        for idx, (test_id, outcome) in enumerate(outcomes, 1):
+            _, cls, meth = split_test_id(test_id)
+            label = f"{pyfile.name}:{cls}.{meth}"
 
-        if details:
-            if code == EXIT_KILLED:
-                status = "KILLED"
+            code, duration, cpu_time, rss_bytes, _ = outcome
+            results.append((label, code, duration))
+
+            class_stats[cls]["time"] += duration
+            if cpu_time is not None:
+                class_stats[cls]["cpu_time"] += cpu_time
+            if rss_bytes is not None:
+                class_stats[cls]["max_rss"] = max(class_stats[cls]["max_rss"], rss_bytes)
+
+            if code == EXIT_PASS:
+                class_stats[cls]["pass"] += 1
             elif code == EXIT_TIMEOUT:
-                status = "TIMEOUT"
-            elif code == EXIT_PASS:
-                status = "PASS"
+                class_stats[cls]["timeout"] += 1
+                failed_labels.append(label)
+            elif code == EXIT_KILLED:
+                class_stats[cls]["killed"] += 1
+                failed_labels.append(label)
+            elif code == EXIT_NOT_RUN:
+                class_stats[cls]["not_run"] += 1
             else:
-                status = "FAIL"
-
-            rss_str = _fmt_bytes(rss_bytes) if rss_bytes is not None else "n/a"
-            print(
-                f"        {status:>7} | "
-                f"wall={duration:>8.2f}s | "
-                f"cpu={_fmt_cpu(cpu_time, duration):>24} | "
-                f"rss={rss_str:>10}"
-            )
-
-        if exit_first and code != EXIT_PASS:
-            break
+                class_stats[cls]["fail"] += 1
+                failed_labels.append(label)
+
+            if details:
+                if code == EXIT_KILLED:
+                    status = "KILLED"
+                elif code == EXIT_TIMEOUT:
+                    status = "TIMEOUT"
+                elif code == EXIT_NOT_RUN:
+                    status = "NOT RUN"
+                elif code == EXIT_PASS:
+                    status = "PASS"
+                else:
+                    status = "FAIL"
+
+                rss_str = _fmt_bytes(rss_bytes) if rss_bytes is not None else "n/a"
+                cpu_str = _fmt_cpu(cpu_time, duration) if cpu_time is not None else "n/a"
+                # Worker threads print child output under the same lock
+                with _OUTPUT_LOCK:
+                    print(f"  [{idx}/{len(test_ids)}] {label}")
+                    print(
+                        f"        {status:>7} | "
+                        f"wall={duration:>8.2f}s | "
+                        f"cpu={cpu_str:>24} | "
+                        f"rss={rss_str:>10}"
+                    )
+
+            # A whole-file run already stopped at its first failure; keep
+            # going so the tests it never reached are reported as not run
+            if exit_first and isolate and code != EXIT_PASS:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     return results, class_stats, failed_labels
 
@@ -397,6 +673,9 @@ def run_test_file(
 def main() -> None:
     """Main entry point for the test runner."""
     args = build_parser().parse_args()
+    if args.jobs <= 0:
+        # Leave headroom for OpenFHE's own threads in each child
+        args.jobs = max(1, (os.cpu_count() or 2) // 2)
 
     # Discover all test files to run
     all_tests: List[Path] = []
@@ -467,11 +746,23 @@ def main() -> None:
     failed_count = 0
     timeout_count = 0
     killed_count = 0
+    not_run_count = 0
     test_time = 0.0
     total_cpu_time = 0.0
     max_reported_rss = 0.0
     all_failed: List[str] = []
 
+    # Parallel test processes share generated crypto contexts through a
+    # temporary disk cache unless the user configured a persistent one.
+    shared_cache: Optional[tempfile.TemporaryDirectory] = None
+    if args.isolate and args.jobs > 1 and not os.environ.get(CC_CACHE_DIR_ENV):
+        shared_cache = tempfile.TemporaryDirectory(prefix="openfhe_cc_")
+        os.environ[CC_CACHE_DIR_ENV] = shared_cache.name
+
+    # Whole-run figures: per-test times overlap when running with --jobs
+    run_start = time.perf_counter()
+    run_cpu_before = _get_children_cpu()
+
     for i, test_file in enumerate(all_tests, 1):
         file_results, class_stats, failed_labels = run_test_file(
             test_file,
@@ -480,6 +771,8 @@ def main() -> None:
             total=n_modules,
             details=args.details,
             exit_first=args.exitfirst,
+            jobs=args.jobs,
+            isolate=args.isolate,
         )
 
         all_failed.extend(failed_labels)
@@ -493,6 +786,7 @@ def main() -> None:
                 failed_count += s["fail"]
                 timeout_count += s["timeout"]
                 killed_count += s["killed"]
+                not_run_count += s["not_run"]
                 test_time += s["time"]
                 total_cpu_time += s["cpu_time"]
                 max_reported_rss = max(max_reported_rss, s["max_rss"])
@@ -500,7 +794,16 @@ def main() -> None:
         if args.exitfirst and (failed_count > 0 or timeout_count > 0 or killed_count > 0):
             break
 
-    total_tests = passed_count + failed_count + timeout_count + killed_count
+    if shared_cache is not None:
+        del os.environ[CC_CACHE_DIR_ENV]
+        shared_cache.cleanup()
+
+    total_tests = passed_count + failed_count + timeout_count + killed_count + not_run_count
+
+    run_time = time.perf_counter() - run_start
+    run_cpu_after = _get_children_cpu()
+    if run_cpu_before is not None and run_cpu_after is not None:
+        total_cpu_time = sum(run_cpu_after) - sum(run_cpu_before)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -511,14 +814,17 @@ def main() -> None:
     print(f"  Failed:              {failed_count}")
     print(f"  Timeouts:            {timeout_count}")
     print(f"  Killed (OOM/signal): {killed_count}")
+    if not_run_count:
+        print(f"  Not run:             {not_run_count}")
 
     if all_failed:
         print("\n  Unsuccessful tests:")
         for label in all_failed:
             print(f"    ✗ {label}")
 
-    print(f"\n  Total wall time:     {test_time:.2f}s")
-    print(f"  Total CPU time:      {_fmt_cpu(total_cpu_time, test_time)}")
+    print(f"\n  Total wall time:     {run_time:.2f}s")
+    print(f"  Sum of test times:   {test_time:.2f}s")
+    print(f"  Total CPU time:      {_fmt_cpu(total_cpu_time, run_time)}")
 
     if max_reported_rss > 0:
         print(f"  Max RSS reported:    {_fmt_bytes(max_reported_rss)}")